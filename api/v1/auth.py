@@ -1,58 +1,76 @@
 """
 Authentication API endpoints for the Todo Application backend.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Form, Request
-from sqlalchemy.orm import Session
-from core.database import get_db
-from schemas.task import UserCreate, User, MessageResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Form
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import dialect_insert, get_db
+from schemas.task import UserCreate, User, MessageResponse, Token
 from models.database import User as UserModel
-from core.security import get_password_hash, verify_password, create_access_token
-from middleware.auth_middleware import JWTBearer
-import uuid
+from core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password_async,
+    create_access_token,
+)
+from middleware.auth_middleware import current_user
 from datetime import timedelta
 
 
 router = APIRouter()
 
+# Statements built once at import; each request only binds parameters
+_STMT_USER_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"))
+
+# Hash checked when the email is unknown so failed logins take the same time
+_DUMMY_HASH = get_password_hash("invalid")
+
 
 @router.post("/auth/register", response_model=User)
-async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_db, scope="function")):
     """
     Register a new user.
     """
-    # Check if user already exists
-    existing_user = db.query(UserModel).filter(UserModel.email == user_data.email).first()
-    if existing_user:
+    hashed_password = await get_password_hash_async(user_data.password)
+
+    # Create the user in a single atomic statement; an existing email yields no row
+    stmt = (
+        dialect_insert(UserModel)
+        .values(
+            email=user_data.email,
+            name=user_data.name,
+            hashed_password=hashed_password
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(UserModel)
+    )
+    result = await db.execute(stmt)
+    db_user = result.scalar_one_or_none()
+
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A user with this email already exists"
         )
 
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    db_user = UserModel(
-        email=user_data.email,
-        name=user_data.name,
-        hashed_password=hashed_password
-    )
-
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-
     # Return only the fields defined in the User schema (excluding hashed_password)
     return db_user
 
 
-@router.post("/auth/login")
-async def login_user(email: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
+@router.post("/auth/login", response_model=Token)
+async def login_user(email: str = Form(...), password: str = Form(...), db: AsyncSession = Depends(get_db, scope="function")):
     """
     Login a user and return a JWT token.
     """
     # Find the user by email
-    user = db.query(UserModel).filter(UserModel.email == email).first()
+    result = await db.execute(_STMT_USER_BY_EMAIL, {"email": email})
+    user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.hashed_password):
+    # Always verify a password so response time doesn't reveal whether the email exists
+    password_valid = await verify_password_async(password, user.hashed_password if user else _DUMMY_HASH)
+    authenticated = password_valid and user is not None
+
+    if not authenticated:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -66,29 +84,13 @@ async def login_user(email: str = Form(...), password: str = Form(...), db: Sess
         expires_delta=access_token_expires
     )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    return Token(access_token=access_token, token_type="bearer")
 
 
 @router.get("/auth/me", response_model=User)
-async def get_current_user(request: Request, db: Session = Depends(get_db), token_data: dict = Depends(JWTBearer())):
+async def get_current_user(user: User = Depends(current_user)):
     """
     Get the current authenticated user's information.
     """
-    try:
-        user_id = uuid.UUID(token_data.get("sub"))
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid user ID format"
-        )
-    
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
     # Return only the fields defined in the User schema (excluding hashed_password)
-    return user
\ No newline at end of file
+    return user
@@ -1,99 +1,138 @@
 """
 Task API endpoints for the Todo Application backend.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from core.database import get_db
-from services.task_service import TaskService
-from schemas.task import TaskCreate, TaskUpdate, Task, TasksResponse, TaskResponse, MessageResponse
-from middleware.auth_middleware import JWTBearer
+from services.task_service import TaskService, decode_task_cursor, encode_task_cursor
+from schemas.task import (
+    TaskCreate, TaskUpdate, Task, TasksCompletionUpdate,
+    TasksResponse, TaskResponse, BulkUpdateResponse, MessageResponse,
+)
+from middleware.auth_middleware import authorized_user_uuid
 from uuid import UUID
-import uuid
 
 
 router = APIRouter()
 
 
+async def get_task_service(db: AsyncSession = Depends(get_db, scope="function")) -> TaskService:
+    """
+    Dependency that provides a TaskService bound to the request's session.
+
+    FastAPI caches dependencies per request, so every use within one request
+    shares the same service and its task cache.
+    """
+    return TaskService(db)
+
+
 @router.get("/{user_id}/tasks", response_model=TasksResponse)
 async def get_tasks(
-    user_id: str,
-    status: Optional[str] = Query(None, description="Filter by status: completed, incomplete"),
+    task_status: Optional[str] = Query(None, alias="status", description="Filter by status: completed, incomplete"),
     priority: Optional[str] = Query(None, description="Filter by priority: high, medium, low"),
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    limit: int = Query(
+        50, ge=1, le=200,
+        description="Maximum number of tasks to return; when a page is full, fetch the rest by passing next_cursor",
+    ),
+    cursor: Optional[str] = Query(None, max_length=100, description="next_cursor from the previous page"),
+    summary: bool = Query(False, description="Leave out task descriptions"),
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
-    Retrieve all tasks for a specific user with optional filtering.
+    Retrieve a page of tasks for a specific user with optional filtering,
+    newest first.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized access to these tasks"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user ID format")
+    cursor_key = None
+    if cursor:
+        try:
+            cursor_key = decode_task_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    tasks = await task_service.get_tasks_by_user(user_uuid, task_status, priority, limit, cursor_key, summary)
+
+    # A full page means there may be more tasks after the last one
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = encode_task_cursor(tasks[-1]["created_at"], tasks[-1]["id"])
+
+    # Returned as a plain dict so the rows are validated once, against the
+    # response model
+    return {"success": True, "data": tasks, "next_cursor": next_cursor}
+
+
+@router.get("/{user_id}/tasks/search", response_model=TasksResponse)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Text to search for in titles and descriptions"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of tasks to return"),
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
+):
+    """
+    Search a specific user's tasks by title and description.
+    """
+    tasks = await task_service.search_tasks(user_uuid, q, limit)
 
-    task_service = TaskService(db)
-    tasks = task_service.get_tasks_by_user(user_uuid, status, priority)
-
-    return TasksResponse(success=True, data=tasks)
+    return {"success": True, "data": tasks}
 
 
 @router.post("/{user_id}/tasks", response_model=TaskResponse)
 async def create_task(
-    user_id: str,
     task_data: TaskCreate,
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
     Create a new task for a specific user.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized to create tasks for this user"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user ID format")
-
-    task_service = TaskService(db)
-    task = task_service.create_task(user_uuid, task_data)
+    task = await task_service.create_task(user_uuid, task_data)
 
     return TaskResponse(success=True, data=task)
 
 
+@router.post("/{user_id}/tasks/bulk", response_model=TasksResponse)
+async def create_tasks_bulk(
+    tasks_data: List[TaskCreate] = Body(..., min_length=1, max_length=500),
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
+):
+    """
+    Create several tasks for a specific user in one request.
+    """
+    tasks = await task_service.create_tasks_bulk(user_uuid, tasks_data)
+
+    return TasksResponse(success=True, data=tasks)
+
+
+@router.patch("/{user_id}/tasks/complete", response_model=BulkUpdateResponse)
+async def set_tasks_completion(
+    completion: TasksCompletionUpdate,
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
+):
+    """
+    Set the completion status of several tasks for a user in one request.
+    """
+    updated = await task_service.toggle_many(user_uuid, completion.task_ids, completion.completed)
+
+    return BulkUpdateResponse(success=True, updated=updated)
+
+
 @router.get("/{user_id}/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
-    user_id: str,
-    task_id: str,
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    task_id: UUID,
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
     Retrieve a specific task for a user.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized access to this task"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-        task_uuid = uuid.UUID(task_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user or task ID format")
-
-    task_service = TaskService(db)
-    task = task_service.get_task_by_id(user_uuid, task_uuid)
+    task = await task_service.get_task_by_id(user_uuid, task_id)
 
     if not task:
         raise HTTPException(
@@ -106,29 +145,15 @@ async def get_task(
 
 @router.put("/{user_id}/tasks/{task_id}", response_model=TaskResponse)
 async def update_task(
-    user_id: str,
-    task_id: str,
+    task_id: UUID,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
     Update a specific task for a user.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized to update this task"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-        task_uuid = uuid.UUID(task_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user or task ID format")
-
-    task_service = TaskService(db)
-    task = task_service.update_task(user_uuid, task_uuid, task_data)
+    task = await task_service.update_task(user_uuid, task_id, task_data)
 
     if not task:
         raise HTTPException(
@@ -141,28 +166,14 @@ async def update_task(
 
 @router.delete("/{user_id}/tasks/{task_id}", response_model=MessageResponse)
 async def delete_task(
-    user_id: str,
-    task_id: str,
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    task_id: UUID,
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
     Delete a specific task for a user.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized to delete this task"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-        task_uuid = uuid.UUID(task_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user or task ID format")
-
-    task_service = TaskService(db)
-    success = task_service.delete_task(user_uuid, task_uuid)
+    success = await task_service.delete_task(user_uuid, task_id)
 
     if not success:
         raise HTTPException(
@@ -175,29 +186,15 @@ async def delete_task(
 
 @router.patch("/{user_id}/tasks/{task_id}/complete", response_model=TaskResponse)
 async def toggle_task_completion(
-    user_id: str,
-    task_id: str,
+    task_id: UUID,
     completed: bool = Query(..., description="Set the completion status"),
-    db: Session = Depends(get_db),
-    token_data: dict = Depends(JWTBearer())
+    task_service: TaskService = Depends(get_task_service),
+    user_uuid: UUID = Depends(authorized_user_uuid)
 ):
     """
     Toggle the completion status of a specific task for a user.
     """
-    # Verify that the user_id in the token matches the one in the URL
-    if token_data.get("sub") != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized to update this task"
-        )
-    try:
-        user_uuid = uuid.UUID(user_id)
-        task_uuid = uuid.UUID(task_id)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid user or task ID format")
-
-    task_service = TaskService(db)
-    task = task_service.toggle_task_completion(user_uuid, task_uuid, completed)
+    task = await task_service.toggle_task_completion(user_uuid, task_id, completed)
 
     if not task:
         raise HTTPException(
@@ -205,4 +202,4 @@ async def toggle_task_completion(
             detail="Task not found"
         )
 
-    return TaskResponse(success=True, data=task)
\ No newline at end of file
+    return TaskResponse(success=True, data=task)
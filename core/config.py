@@ -2,11 +2,10 @@
 Configuration settings for the Todo Application backend.
 """
 import os
+from functools import lru_cache
 from typing import List
 from dotenv import load_dotenv
 
-load_dotenv() # Load environment variables from .env file
-
 
 class Settings:
     """
@@ -26,25 +25,52 @@ class Settings:
 
         # Database settings
         self.DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
-        print(f"DEBUG: Using DATABASE_URL: {self.DATABASE_URL}")
+        # Set when connecting through PgBouncer in transaction mode (e.g. Neon's
+        # pooled endpoint), which cannot keep prepared statements across transactions
+        self.DATABASE_PGBOUNCER = os.getenv("DATABASE_PGBOUNCER", "False").lower() == "true"
+        # Connection pool settings (ignored for SQLite)
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 40))
+        self.DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+        self.DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+        # Number of compiled SQL statements SQLAlchemy keeps per engine
+        self.DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", 1200))
 
         # Auth settings
         self.BETTER_AUTH_SECRET = os.getenv("BETTER_AUTH_SECRET", "your-secret-key-here")
+        # bcrypt cost factor; calibrated at startup when not set
+        bcrypt_rounds = os.getenv("BCRYPT_ROUNDS")
+        self.BCRYPT_ROUNDS = int(bcrypt_rounds) if bcrypt_rounds else None
 
-        # CORS settings
-        self.ALLOWED_ORIGINS = [
+        # CORS settings; browsers send Origin without a trailing slash, so
+        # normalize once here rather than carrying entries that never match
+        self.ALLOWED_ORIGINS = tuple(dict.fromkeys(origin.rstrip("/") for origin in (
             "https://new-hackathon-2-reusable-intelligen.vercel.app",
             "http://localhost",
             "http://localhost:3000",  # Default Next.js port
             "http://127.0.0.1:3000",
             "http://localhost:8000",  # For API testing
             "http://127.0.0.1:8000",
-            "https://new-hackathon-2-reusable-intelligen-peach.vercel.app"
-        ]
+            "https://new-hackathon-2-reusable-intelligen-peach.vercel.app",
+        )))
 
         # Debug mode
         self.DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Build the application settings once per process.
+
+    The .env file is only read when SKIP_DOTENV is unset, so deployments that
+    inject environment variables directly skip the filesystem lookup.
+    """
+    if not os.getenv("SKIP_DOTENV"):
+        load_dotenv()  # Load environment variables from .env file
+
+    return Settings()
+
+
 # Create a settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -1,33 +1,125 @@
 """
 Database connection and session management for the Todo Application backend.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from core.config import settings
 
 
-# Create the database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    # For PostgreSQL with Neon, we might need specific options
-    pool_pre_ping=True,
-    # Additional options can be added as needed
+def get_async_database_url(database_url: str) -> URL:
+    """
+    Translate a database URL into the equivalent URL for its async driver.
+
+    Args:
+        database_url: Database URL as configured (e.g. postgresql://... or sqlite:///...)
+
+    Returns:
+        URL using asyncpg for PostgreSQL and aiosqlite for SQLite
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend in ("postgresql", "postgres"):
+        # asyncpg does not understand libpq's sslmode/channel_binding parameters
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        if sslmode:
+            query["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url
+
+
+DATABASE_URL = get_async_database_url(settings.DATABASE_URL)
+
+if DATABASE_URL.get_backend_name() == "sqlite":
+    # Keep a few connections open so the WAL/pragma setup is paid once per
+    # connection rather than once per request
+    engine_options = {"pool_pre_ping": True, "pool_size": 5}
+else:
+    # For PostgreSQL with Neon, size the pool for concurrent requests, check
+    # connections on checkout and recycle them before the provider drops idle ones
+    engine_options = {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # asyncpg caches prepared statements per connection so hot queries skip
+    # re-parsing and planning; PgBouncer in transaction mode can't support that
+    if settings.DATABASE_PGBOUNCER:
+        engine_options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
+
+# Create the async database engine. The compiled statement cache is sized
+# above SQLAlchemy's default of 500 so the task list's filter combinations
+# and the other statements never evict each other.
+engine = create_async_engine(
+    DATABASE_URL, query_cache_size=settings.DB_QUERY_CACHE_SIZE, **engine_options
 )
 
-# Create a configured "SessionLocal" class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if DATABASE_URL.get_backend_name() == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Enable WAL so readers don't block writers, and trade fsyncs for speed
+        in the local development database.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+
+# Create a configured "AsyncSessionLocal" class
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 # Create a Base class for declarative models
 Base = declarative_base()
 
 
-def get_db():
+def dialect_insert(entity):
+    """
+    Create an INSERT construct for the configured database that supports
+    ON CONFLICT clauses.
+
+    Args:
+        entity: Mapped class or table to insert into
+
+    Returns:
+        A PostgreSQL or SQLite dialect Insert
     """
-    Dependency function that provides a database session for FastAPI endpoints.
+    if DATABASE_URL.get_backend_name() == "sqlite":
+        return sqlite_insert(entity)
+    return postgresql_insert(entity)
+
+
+async def get_db():
+    """
+    Dependency function that provides an async database session for FastAPI endpoints.
+
+    The session is committed once after the endpoint returns, so all writes made
+    during a request share one transaction; if the endpoint raises, the
+    transaction is rolled back. Declare it with Depends(get_db, scope="function")
+    so the commit completes before the response is sent.
     """
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     try:
         yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        await db.close()
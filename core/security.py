@@ -1,16 +1,139 @@
 """
 Security utilities for the Todo Application backend.
 """
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
-import jwt
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import math
+import threading
+import time
+from cachetools import TTLCache
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
 from fastapi import HTTPException, status
 from core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Target duration of a single password hash/verify on this host
+BCRYPT_TARGET_SECONDS = 0.25
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+
+def _calibrate_bcrypt_rounds(target_seconds: float = BCRYPT_TARGET_SECONDS) -> int:
+    """
+    Pick the smallest bcrypt cost that takes at least target_seconds on this host.
+
+    Hashes a dummy password once at the minimum cost and extrapolates, since
+    every extra round doubles the work.
+
+    Args:
+        target_seconds: Minimum time a single hash should take
+
+    Returns:
+        bcrypt rounds to use
+    """
+    start = time.perf_counter()
+    bcrypt.using(rounds=BCRYPT_MIN_ROUNDS).hash("calibration-password")
+    elapsed = time.perf_counter() - start
+
+    extra_rounds = max(0, math.ceil(math.log2(target_seconds / elapsed))) if elapsed > 0 else 0
+    return min(BCRYPT_MIN_ROUNDS + extra_rounds, BCRYPT_MAX_ROUNDS)
+
+
+# Password hashing context. pbkdf2_sha256 is kept only so that hashes created
+# before the switch to bcrypt can still be verified.
+pwd_context = CryptContext(
+    schemes=["bcrypt", "pbkdf2_sha256"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS or _calibrate_bcrypt_rounds(),
+)
+
+
+def _prehash_password(password: str) -> str:
+    """
+    Reduce a password to a fixed-length, NUL-free string before bcrypt.
+
+    bcrypt silently truncates input at 72 bytes and rejects NUL bytes, so the
+    password is first digested with SHA-256 and base64 encoded (44 bytes).
+    """
+    digest = hashlib.sha256(password.encode("utf-8")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+# Dedicated, bounded pool for password hashing so the CPU-bound work stays off
+# the event loop and a burst of logins cannot exhaust the default thread pool
+_password_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="password-hash")
+
+
+# Decoded JWT payloads keyed by a truncated SHA-256 of the token
+_jwt_cache = TTLCache(maxsize=10_000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+# HS256 signing key and the pre-encoded header shared by every issued token
+_JWT_KEY = settings.BETTER_AUTH_SECRET.encode("utf-8")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_JWT_HEADER = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _sign(signing_input: bytes) -> bytes:
+    """
+    Compute the HS256 signature using OpenSSL's one-shot HMAC.
+    """
+    return hmac.digest(_JWT_KEY, signing_input, "sha256")
+
+
+def _decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Check an HS256 JWT's signature and expiry and return its payload.
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        Token payload if valid, None if invalid
+    """
+    try:
+        segments = token.encode("ascii").split(b".")
+        if len(segments) != 3:
+            return None
+        header_segment, payload_segment, signature_segment = segments
+
+        signing_input = header_segment + b"." + payload_segment
+        if not hmac.compare_digest(_b64url_decode(signature_segment), _sign(signing_input)):
+            return None
+
+        header = json.loads(_b64url_decode(header_segment))
+        payload = json.loads(_b64url_decode(payload_segment))
+    except (ValueError, binascii.Error):
+        # Covers non-ASCII input, bad base64 and malformed JSON
+        return None
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp <= time.time():
+        return None
+
+    return payload
 
 
 # JWT token utilities
@@ -28,20 +151,18 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
         # Default to 7 days if no expiration is provided
-        expire = datetime.utcnow() + timedelta(days=7)
+        expire = datetime.now(timezone.utc) + timedelta(days=7)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": int(expire.timestamp())})
     
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.BETTER_AUTH_SECRET, 
-        algorithm="HS256"
-    )
+    payload = _b64url_encode(json.dumps(to_encode, separators=(",", ":")).encode("utf-8"))
+    signing_input = _JWT_HEADER + b"." + payload
+    encoded_jwt = signing_input + b"." + _b64url_encode(_sign(signing_input))
     
-    return encoded_jwt
+    return encoded_jwt.decode("ascii")
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
@@ -54,16 +175,26 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     Returns:
         Token payload if valid, None if invalid
     """
-    try:
-        payload = jwt.decode(
-            token, 
-            settings.BETTER_AUTH_SECRET, 
-            algorithms=["HS256"]
-        )
-        return payload
-    except jwt.PyJWTError:
+    key = hashlib.sha256(token.encode("utf-8")).digest()[:16]
+
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+        if payload is not None:
+            if payload.get("exp", 0) > time.time():
+                return payload
+            # Token expired within the cache TTL window
+            del _jwt_cache[key]
+            return None
+
+    payload = _decode_token(token)
+    if payload is None:
         return None
 
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+
+    return payload
+
 
 def get_password_hash(password: str) -> str:
     """
@@ -75,7 +206,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    return pwd_context.hash(_prehash_password(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -89,4 +220,37 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if passwords match, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    if pwd_context.identify(hashed_password, required=False) == "pbkdf2_sha256":
+        # Legacy hashes were computed over the raw password
+        return pwd_context.verify(plain_password, hashed_password)
+
+    return pwd_context.verify(_prehash_password(plain_password), hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Generate a hash for the given password without blocking the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain text password against its hash without blocking the event loop.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if passwords match, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
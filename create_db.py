@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import os
 
@@ -8,6 +9,14 @@ from backend.models.database import Base
 # Import all models to ensure they are registered with the Base
 from backend.models.database import User, Task
 
-print("Creating database tables...")
-Base.metadata.create_all(bind=engine)
-print("Database tables created.")
+
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    print("Creating database tables...")
+    asyncio.run(create_tables())
+    print("Database tables created.")
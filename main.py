@@ -1,6 +1,7 @@
 """
 FastAPI application for the Todo Application backend.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -16,21 +17,37 @@ except ImportError as e:
     print(f"Failed to import required modules: {e}")
     raise
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Bootstrap the local SQLite database in debug mode and release pooled
+    connections on shutdown. Other databases are migrated with
+    `alembic upgrade head` as part of the deploy.
+    """
+    if settings.DEBUG and settings.DATABASE_URL.startswith("sqlite"):
+        try:
+            # Create database tables
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        except Exception as e:
+            print(f"Failed to create database tables: {e}")
+            raise
+
+    yield
+
+    await engine.dispose()
+
+
 # Create the FastAPI app instance
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Todo Application API - Backend for the Todo Application",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
-try:
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-except Exception as e:
-    print(f"Failed to create database tables: {e}")
-    raise
-
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -1,10 +1,17 @@
 """
 Authentication middleware for the Todo Application backend.
 """
-from fastapi import Request, HTTPException, status
+import hmac
+from uuid import UUID
+from cachetools import TTLCache
+from fastapi import Depends, Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_db
 from core.security import verify_token
-from schemas.task import TokenData
+from models.database import User as UserModel
+from schemas.task import TokenData, User
 
 
 class JWTBearer(HTTPBearer):
@@ -40,4 +47,81 @@ class JWTBearer(HTTPBearer):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authorization code."
-            )
\ No newline at end of file
+            )
+
+
+# Shared instance used by all protected routes
+jwt_bearer = JWTBearer()
+
+# Statement built once at import; each lookup only binds the user ID
+_STMT_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("user_id"))
+
+# Users resolved from token subjects, keyed by the subject string
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+
+
+async def authorized_user_uuid(user_id: UUID, token_data: dict = Depends(jwt_bearer)) -> UUID:
+    """
+    Resolve the user_id path parameter for a route the token holder may access.
+
+    FastAPI parses and validates the UUID before this runs, so a malformed ID
+    is rejected with a 422.
+
+    Args:
+        user_id: User ID from the request path
+        token_data: Decoded JWT payload
+
+    Returns:
+        The user UUID
+    """
+    # Verify that the user_id in the token matches the one in the URL; tokens
+    # carry the canonical string form of the UUID
+    token_user_id = str(token_data.get("sub", ""))
+    if not hmac.compare_digest(token_user_id.encode("utf-8"), str(user_id).encode("utf-8")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized access to this user's tasks"
+        )
+
+    return user_id
+
+
+async def current_user(token_data: dict = Depends(jwt_bearer), db: AsyncSession = Depends(get_db, scope="function")) -> User:
+    """
+    Resolve the authenticated user, reusing recent lookups for the same token subject.
+
+    Args:
+        token_data: Decoded JWT payload
+        db: Database session used on a cache miss
+
+    Returns:
+        The authenticated user
+    """
+    sub = token_data.get("sub")
+    user = _user_cache.get(sub)
+    if user is not None:
+        return user
+
+    try:
+        user_id = UUID(sub)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid user ID format"
+        )
+
+    result = await db.execute(_STMT_USER_BY_ID, {"user_id": user_id})
+    db_user = result.scalar_one_or_none()
+
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    # Cache the response schema rather than the ORM instance so nothing
+    # session-bound is shared between requests
+    user = User.model_validate(db_user)
+    _user_cache[sub] = user
+
+    return user
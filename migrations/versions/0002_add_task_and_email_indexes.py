@@ -0,0 +1,56 @@
+"""Add task and email indexes
+
+Indexes are built with CREATE INDEX CONCURRENTLY on PostgreSQL so existing
+deployments do not lock the tables while they build.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 09:05:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id", "tasks", ["user_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_user_priority_completed", "tasks", ["user_id", "priority", "completed"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_users_email", "users", ["email"], unique=True,
+            postgresql_concurrently=True,
+        )
+
+    if is_postgresql:
+        # The unique index now enforces email uniqueness
+        op.drop_constraint("users_email_key", "users", type_="unique")
+
+
+def downgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    if is_postgresql:
+        op.create_unique_constraint("users_email_key", "users", ["email"])
+
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_email", "users", postgresql_concurrently=True)
+        op.drop_index("ix_tasks_user_priority_completed", "tasks", postgresql_concurrently=True)
+        op.drop_index("ix_tasks_user_id", "tasks", postgresql_concurrently=True)
@@ -0,0 +1,55 @@
+"""Add composite task indexes
+
+Adds (user_id, completed) for status filters and (user_id, id) for lookups
+and id-ordered listing. ix_tasks_user_id is dropped because (user_id, id)
+covers it as a leftmost prefix.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id_id", "tasks", ["user_id", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tasks_user_completed", "tasks", ["user_id", "completed"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_id", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id", "tasks", ["user_id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_completed", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_id_id", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,40 @@
+"""Add partial index for incomplete tasks
+
+Indexes (user_id, id) over incomplete tasks only, which is what dashboards
+list and page through.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_incomplete", "tasks", ["user_id", "id"],
+            postgresql_where=sa.text("completed = false"),
+            sqlite_where=sa.text("completed = 0"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_user_incomplete", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,51 @@
+"""Add full-text search index on tasks
+
+GIN index over the English tsvector of title and description, used by task
+search. PostgreSQL only; other databases search with substring matching.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 11:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match models.database.TASK_SEARCH_DOCUMENT
+TASK_SEARCH_DOCUMENT = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_search", "tasks", [sa.text(TASK_SEARCH_DOCUMENT)],
+            postgresql_using="gin",
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_search", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,56 @@
+"""Rebuild the incomplete-task partial index with an IS FALSE predicate
+
+Task queries now filter with completed IS FALSE; the partial index predicate
+is changed to the same form so the planner can always match it. The new
+index is built under a temporary name and swapped in, so status=incomplete
+queries keep an index throughout.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _swap_incomplete_index(postgresql_where: str, sqlite_where: str) -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_incomplete_new", "tasks", ["user_id", "id"],
+            postgresql_where=sa.text(postgresql_where),
+            sqlite_where=sa.text(sqlite_where),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_incomplete", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER INDEX ix_tasks_user_incomplete_new RENAME TO ix_tasks_user_incomplete")
+    else:
+        # SQLite cannot rename an index; build it again under the final name
+        op.create_index(
+            "ix_tasks_user_incomplete", "tasks", ["user_id", "id"],
+            sqlite_where=sa.text(sqlite_where),
+        )
+        op.drop_index("ix_tasks_user_incomplete_new", "tasks")
+
+
+def upgrade() -> None:
+    _swap_incomplete_index("completed IS false", "completed IS 0")
+
+
+def downgrade() -> None:
+    _swap_incomplete_index("completed = false", "completed = 0")
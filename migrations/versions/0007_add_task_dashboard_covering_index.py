@@ -0,0 +1,48 @@
+"""Add covering dashboard index on tasks
+
+Adds (user_id, priority, completed, id) INCLUDE (title) for priority and
+status filtered, id ordered listings. It replaces
+ix_tasks_user_priority_completed, which is a prefix of it.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_dashboard", "tasks", ["user_id", "priority", "completed", "id"],
+            postgresql_include=["title"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_priority_completed", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_priority_completed", "tasks", ["user_id", "priority", "completed"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_dashboard", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
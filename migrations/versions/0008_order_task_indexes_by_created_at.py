@@ -0,0 +1,91 @@
+"""Order task list indexes by (created_at, id)
+
+Task lists are now sorted and paged newest first by (created_at, id) instead
+of by the random task UUID. (user_id, created_at, id) replaces
+ix_tasks_user_id_id, and the dashboard and incomplete-task indexes gain
+created_at ahead of id. Replaced indexes are built under a temporary name and
+swapped in, so list queries keep an index throughout.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INCOMPLETE_WHERE = {
+    "postgresql_where": sa.text("completed IS false"),
+    "sqlite_where": sa.text("completed IS 0"),
+}
+
+
+def _replace_index(name: str, columns: Sequence[str], **kw) -> None:
+    """
+    Rebuild an index with new columns under the same name.
+    """
+    temporary_name = f"{name}_new"
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            temporary_name, "tasks", columns,
+            postgresql_concurrently=True, if_not_exists=True, **kw,
+        )
+        op.drop_index(
+            name, "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(f"ALTER INDEX {temporary_name} RENAME TO {name}")
+    else:
+        # SQLite cannot rename an index; build it again under the final name
+        op.create_index(name, "tasks", columns, **kw)
+        op.drop_index(temporary_name, "tasks")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_created_id", "tasks", ["user_id", "created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_id_id", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+    _replace_index(
+        "ix_tasks_dashboard", ["user_id", "priority", "completed", "created_at", "id"],
+        postgresql_include=["title"],
+    )
+    _replace_index("ix_tasks_user_incomplete", ["user_id", "created_at", "id"], **INCOMPLETE_WHERE)
+
+
+def downgrade() -> None:
+    _replace_index("ix_tasks_user_incomplete", ["user_id", "id"], **INCOMPLETE_WHERE)
+    _replace_index(
+        "ix_tasks_dashboard", ["user_id", "priority", "completed", "id"],
+        postgresql_include=["title"],
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id_id", "tasks", ["user_id", "id"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_created_id", "tasks",
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -1,7 +1,7 @@
 """
 Database models for the Todo Application backend using SQLAlchemy.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, UUID, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, UUID, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -9,6 +9,13 @@ import uuid
 from core.database import Base
 
 
+# Full-text document for task search on PostgreSQL. Queries must use this exact
+# expression for the planner to match it to ix_tasks_search.
+TASK_SEARCH_DOCUMENT = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
 class User(Base):
     """
     User model representing a user in the system.
@@ -16,14 +23,16 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), unique=True, nullable=False)
+    email = Column(String(255), unique=True, index=True, nullable=False)
     name = Column(String(255), nullable=True)
     hashed_password = Column(String, nullable=False)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
-    # Relationship to tasks would be defined here if needed
-    # tasks = relationship("Task", back_populates="user")
+    # Relationships raise on lazy access so unplanned per-row loads fail loudly;
+    # load them explicitly with selectinload() when needed.
+    # passive_deletes lets the database's ON DELETE CASCADE remove tasks.
+    tasks = relationship("Task", back_populates="user", lazy="raise", passive_deletes=True)
 
 
 class Task(Base):
@@ -31,6 +40,35 @@ class Task(Base):
     Task model representing a task in the system.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Postgres does not index foreign keys; every task query filters on user_id,
+        # so it leads each index and the equality predicate always applies.
+        # Task lists are ordered and paged by (created_at, id); this index serves
+        # unfiltered pages without a sort and also plain user_id lookups.
+        Index("ix_tasks_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_completed", "user_id", "completed"),
+        # Dashboard lists filter on priority and status: equality on the first
+        # three columns leaves rows in (created_at, id) order, so no sort is
+        # needed. Also serves (user_id, priority) filters as its leftmost prefix.
+        # INCLUDE lets PostgreSQL answer title-only listings from the index alone.
+        Index(
+            "ix_tasks_dashboard", "user_id", "priority", "completed", "created_at", "id",
+            postgresql_include=["title"],
+        ),
+        # Dashboards mostly list incomplete tasks; indexing only those rows keeps
+        # the index small and serves status=incomplete pages in list order
+        Index(
+            "ix_tasks_user_incomplete", "user_id", "created_at", "id",
+            postgresql_where=text("completed IS false"),
+            sqlite_where=text("completed IS 0"),
+        ),
+        # Expression GIN index for full-text search; PostgreSQL only, SQLite
+        # falls back to substring matching
+        Index(
+            "ix_tasks_search", text(TASK_SEARCH_DOCUMENT),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -41,5 +79,4 @@ class Task(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
-    # Relationship to user would be defined here if needed
-    # user = relationship("User", back_populates="tasks")
\ No newline at end of file
+    user = relationship("User", back_populates="tasks", lazy="raise")
\ No newline at end of file
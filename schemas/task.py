@@ -2,7 +2,7 @@
 Pydantic schemas for API requests and responses.
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 import uuid
 
@@ -32,8 +32,8 @@ class TaskBase(BaseModel):
     title: str = Field(min_length=1, max_length=255)
     description: Optional[str] = None
     completed: bool = False
-    priority: Optional[str] = Field(default="medium", pattern="^(low|medium|high)$")  # low, medium, high
-    tags: Optional[List[str]] = []
+    priority: Optional[Literal["low", "medium", "high"]] = "medium"
+    tags: List[str] = Field(default_factory=list)
 
 
 class TaskCreate(TaskBase):
@@ -44,7 +44,7 @@ class TaskUpdate(BaseModel):
     title: Optional[str] = Field(default=None, min_length=1, max_length=255)
     description: Optional[str] = None
     completed: Optional[bool] = None
-    priority: Optional[str] = Field(default=None, pattern="^(low|medium|high)$")  # low, medium, high
+    priority: Optional[Literal["low", "medium", "high"]] = None
     tags: Optional[List[str]] = None
 
 
@@ -58,6 +58,11 @@ class Task(TaskBase):
         from_attributes = True
 
 
+class TasksCompletionUpdate(BaseModel):
+    task_ids: List[uuid.UUID] = Field(min_length=1, max_length=500)
+    completed: bool
+
+
 # Response schemas
 class TaskResponse(BaseModel):
     success: bool
@@ -67,6 +72,12 @@ class TaskResponse(BaseModel):
 class TasksResponse(BaseModel):
     success: bool
     data: List[Task]
+    next_cursor: Optional[str] = None
+
+
+class BulkUpdateResponse(BaseModel):
+    success: bool
+    updated: int
 
 
 class MessageResponse(BaseModel):
@@ -74,5 +85,10 @@ class MessageResponse(BaseModel):
     message: str
 
 
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+
+
 class TokenData(BaseModel):
     user_id: str
\ No newline at end of file
@@ -1,11 +1,166 @@
 """
 Service layer for managing Task business logic in the backend.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from models.database import Task, User
-from schemas.task import TaskCreate, TaskUpdate
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import (
+    DateTime, Integer, bindparam, delete, func, insert, literal_column, or_, select,
+    tuple_, update,
+)
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from models.database import TASK_SEARCH_DOCUMENT, Task, User
+from schemas.task import TaskCreate, TaskUpdate, Task as TaskSchema
+
+
+# Columns needed to build a TaskSchema; selecting them directly skips ORM
+# object construction and attribute instrumentation on the list path
+_TASK_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.title,
+    Task.description,
+    Task.completed,
+    Task.priority,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# List-view variant without the description, which is unbounded text and not
+# shown in task lists; the schema defaults it to None
+_TASK_SUMMARY_COLUMNS = tuple(column for column in _TASK_COLUMNS if column is not Task.description)
+
+# Loader options for Task entities: any relationship, including ones added to
+# the model later without lazy="raise", raises on access instead of issuing a
+# query per task. Callers that need one must load it explicitly, e.g. with
+# selectinload(Task.user).
+_TASK_LOAD_OPTIONS = (raiseload("*"),)
+
+# Task lists are ordered newest first by creation time, with the random UUID
+# only breaking ties, and page with a keyset cursor on the same two columns
+_TASK_LIST_ORDER = (Task.created_at.desc(), Task.id.desc())
+
+# SQLite stores the func.now() defaults as whole-second text and compares
+# created_at as text, so the cursor timestamp is bound in that same format
+# there; the default SQLite format appends microseconds, which would sort
+# after every row created in the same second
+_CURSOR_CREATED_AT_TYPE = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+# Statements built once at import; each call only binds parameters, and the
+# compiled form is reused from the engine's cache.
+# The default "evaluate" session synchronization would evaluate these criteria
+# against the bind parameters' build-time values rather than the ones passed
+# at execution, leaving tasks already loaded in the session stale. The DELETE
+# fetches the matched keys to evict them from the session instead, and the
+# UPDATE overwrites loaded tasks with the row it returns.
+_STMT_DELETE_TASK = (
+    delete(Task)
+    .where(Task.user_id == bindparam("uid"), Task.id == bindparam("tid"))
+    .returning(Task.id)
+    .execution_options(synchronize_session="fetch")
+)
+_STMT_SET_TASK_COMPLETED = (
+    update(Task)
+    .where(Task.user_id == bindparam("uid"), Task.id == bindparam("tid"))
+    .values(completed=bindparam("completed_value"))
+    .returning(Task)
+    .options(*_TASK_LOAD_OPTIONS)
+    .execution_options(synchronize_session=False, populate_existing=True)
+)
+
+
+@lru_cache(maxsize=None)
+def _task_list_statement(completed: Optional[bool], by_priority: bool, summary: bool,
+                         after_cursor: bool = False, paginated: bool = False):
+    """
+    Build the column query for a user's tasks for one combination of filters.
+
+    Every value is a bind parameter (user_id, priority, the cursor_created_at
+    and cursor_id keyset, limit), so
+    each of the few possible shapes is built once and then reused, and its
+    compiled form stays in the engine's statement cache.
+    """
+    columns = _TASK_SUMMARY_COLUMNS if summary else _TASK_COLUMNS
+    stmt = select(*columns).where(Task.user_id == bindparam("user_id"))
+
+    if completed is not None:
+        # IS TRUE/IS FALSE renders the value inline, matching the predicate of
+        # the ix_tasks_user_incomplete partial index
+        stmt = stmt.where(Task.completed.is_(completed))
+    if by_priority:
+        stmt = stmt.where(Task.priority == bindparam("priority"))
+
+    # Keyset pagination walks the (user_id, created_at, id) index backwards
+    # and stops after limit rows, however deep the page
+    if after_cursor:
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) < tuple_(
+            bindparam("cursor_created_at", type_=_CURSOR_CREATED_AT_TYPE),
+            bindparam("cursor_id", type_=Task.id.type),
+        ))
+    if paginated:
+        stmt = stmt.order_by(*_TASK_LIST_ORDER).limit(bindparam("limit", type_=Integer))
+
+    return stmt
+
+
+def _completed_filter(status: Optional[str]) -> Optional[bool]:
+    """
+    Map a status filter ("completed", "incomplete", "all") to a completed value.
+    """
+    if status == "completed":
+        return True
+    if status == "incomplete":
+        return False
+    return None
+
+
+def encode_task_cursor(created_at: datetime, task_id: UUID) -> str:
+    """
+    Build the opaque pagination cursor that resumes after the given task.
+
+    Args:
+        created_at: Creation time of the last task on the page
+        task_id: ID of the last task on the page
+
+    Returns:
+        Cursor string for the next page
+    """
+    return f"{created_at.isoformat()}_{task_id}"
+
+
+def decode_task_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Split a pagination cursor back into its creation time and task ID.
+
+    Args:
+        cursor: Cursor built by encode_task_cursor
+
+    Returns:
+        The (created_at, task_id) keyset the cursor points at
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, separator, task_id = cursor.rpartition("_")
+    if not separator:
+        raise ValueError("Invalid cursor")
+
+    created_at = datetime.fromisoformat(created_at)
+    # created_at is stored without a time zone; an offset could not be
+    # compared against it
+    if created_at.tzinfo is not None:
+        raise ValueError("Invalid cursor")
+
+    return created_at, UUID(task_id)
 
 
 class TaskService:
@@ -13,16 +168,20 @@ class TaskService:
     Service class for managing Task business logic.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         """
         Initialize the service with a database session.
 
         Args:
-            db_session: The database session to use
+            db_session: The async database session to use
         """
         self.db_session = db_session
+        # Tasks already resolved for a user during this service's lifetime,
+        # keyed by (user_id, task_id). Services are created per request, so
+        # entries never outlive the request's session.
+        self._cache: Dict[Tuple[str, str], Task] = {}
 
-    def create_task(self, user_id: str, task_data: TaskCreate) -> Task:
+    async def create_task(self, user_id: str, task_data: TaskCreate) -> Task:
         """
         Create a new task for a user.
 
@@ -33,23 +192,49 @@ class TaskService:
         Returns:
             The created Task object
         """
-        # Create a new Task instance from the provided data
-        task = Task(
-            user_id=user_id,
-            title=task_data.title,
-            description=task_data.description,
-            completed=task_data.completed,
-            priority=task_data.priority
+        # Insert the task and read back its generated columns in a single
+        # statement; tags are accepted by the schema but not persisted
+        task = await self.db_session.scalar(
+            insert(Task)
+            .values(user_id=user_id, **task_data.model_dump(exclude={"tags"}))
+            .returning(Task)
+            .options(*_TASK_LOAD_OPTIONS)
         )
 
-        # Add the task to the session and commit
-        self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
-
+        self._cache[(user_id, task.id)] = task
         return task
 
-    def get_task_by_id(self, user_id: str, task_id: str) -> Optional[Task]:
+    async def create_tasks_bulk(self, user_id: str, tasks_data: List[TaskCreate]) -> List[Task]:
+        """
+        Create several tasks for a user at once.
+
+        Args:
+            user_id: The ID of the user creating the tasks
+            tasks_data: The task data to create
+
+        Returns:
+            The created Task objects, in the same order as tasks_data
+        """
+        if not tasks_data:
+            return []
+
+        # Tags are accepted by the schema but not persisted
+        rows = [
+            {"user_id": user_id, **task_data.model_dump(exclude={"tags"})}
+            for task_data in tasks_data
+        ]
+
+        # A list of parameter sets makes this an executemany, which SQLAlchemy
+        # sends as multi-row INSERT ... RETURNING statements instead of one
+        # INSERT per task through the unit of work
+        result = await self.db_session.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True).options(*_TASK_LOAD_OPTIONS),
+            rows,
+        )
+
+        return list(result)
+
+    async def get_task_by_id(self, user_id: str, task_id: str) -> Optional[Task]:
         """
         Retrieve a specific task for a user by its ID.
 
@@ -60,47 +245,127 @@ class TaskService:
         Returns:
             The Task object if found and belongs to the user, None otherwise
         """
-        # Query for the task that belongs to the specified user
-        task = self.db_session.query(Task).filter(
-            and_(Task.user_id == user_id, Task.id == task_id)
-        ).first()
+        key = (user_id, task_id)
+        if key in self._cache:
+            return self._cache[key]
+
+        # Look up by primary key so the session's identity map can answer
+        # without a query, then check ownership in Python
+        task = await self.db_session.get(Task, task_id, options=_TASK_LOAD_OPTIONS)
+        if not task or task.user_id != user_id:
+            return None
 
+        self._cache[key] = task
         return task
 
-    def get_tasks_by_user(self, user_id: str,
-                         status: Optional[str] = None,
-                         priority: Optional[str] = None) -> List[Task]:
+    async def get_tasks_by_user(self, user_id: str,
+                               status: Optional[str] = None,
+                               priority: Optional[str] = None,
+                               limit: int = 50,
+                               cursor: Optional[Tuple[datetime, UUID]] = None,
+                               summary: bool = False) -> List[RowMapping]:
         """
-        Retrieve all tasks for a specific user with optional filters.
+        Retrieve a page of tasks for a specific user with optional filters.
+
+        Tasks are ordered newest first by creation time, then by ID. Pass the
+        (created_at, id) of the last task of a page as cursor to get the next
+        page.
 
         Args:
             user_id: The ID of the user
             status: Optional filter for task status ("completed", "incomplete", "all")
             priority: Optional filter for task priority ("high", "medium", "low")
+            limit: Maximum number of tasks to return
+            cursor: Optional (created_at, id) keyset of the last task of the
+                previous page, as returned by decode_task_cursor
+            summary: Leave out task descriptions
 
         Returns:
-            A list of Task objects for the user
+            A list of task rows for the user, shaped like the Task schema
         """
-        # Start with a base query for tasks belonging to the user
-        query = self.db_session.query(Task).filter(Task.user_id == user_id)
+        cursor_created_at, cursor_id = cursor if cursor else (None, None)
 
-        # Apply status filter if provided
-        if status:
-            if status == "completed":
-                query = query.filter(Task.completed == True)
-            elif status == "incomplete":
-                query = query.filter(Task.completed == False)
+        query = _task_list_statement(
+            _completed_filter(status), bool(priority), summary,
+            after_cursor=bool(cursor), paginated=True,
+        )
+        params = {
+            "user_id": user_id,
+            "priority": priority,
+            "cursor_created_at": cursor_created_at,
+            "cursor_id": cursor_id,
+            "limit": limit,
+        }
+
+        # Execute the query and return the rows as mappings; the endpoint's
+        # response model validates them in one pass, so no per-row schema
+        # or ORM object is built here
+        result = await self.db_session.execute(query, params)
+
+        return result.mappings().all()
+
+    async def search_tasks(self, user_id: str, q: str, limit: int = 50) -> List[RowMapping]:
+        """
+        Search a user's tasks by title and description.
 
-        # Apply priority filter if provided
-        if priority:
-            query = query.filter(Task.priority == priority)
+        On PostgreSQL this is an English full-text match served by the
+        ix_tasks_search GIN index; other databases fall back to a
+        case-insensitive substring match.
 
-        # Execute the query and return results
-        tasks = query.all()
+        Args:
+            user_id: The ID of the user
+            q: Search text
+            limit: Maximum number of tasks to return
 
-        return tasks
+        Returns:
+            A list of matching task rows, newest first
+        """
+        query = select(*_TASK_COLUMNS).where(Task.user_id == user_id)
+
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            query = query.where(
+                literal_column(TASK_SEARCH_DOCUMENT).op("@@")(
+                    func.plainto_tsquery(literal_column("'english'"), q)
+                )
+            )
+        else:
+            query = query.where(or_(
+                Task.title.icontains(q, autoescape=True),
+                Task.description.icontains(q, autoescape=True),
+            ))
+
+        query = query.order_by(*_TASK_LIST_ORDER).limit(limit)
+        result = await self.db_session.execute(query)
+
+        return result.mappings().all()
+
+    async def stream_tasks_by_user(self, user_id: str,
+                                   status: Optional[str] = None,
+                                   priority: Optional[str] = None) -> AsyncIterator[TaskSchema]:
+        """
+        Stream every task for a user, for callers such as exports that need
+        all rows rather than a page.
+
+        Rows are fetched from the server in chunks so memory use stays flat
+        regardless of how many tasks the user has.
+
+        Args:
+            user_id: The ID of the user
+            status: Optional filter for task status ("completed", "incomplete", "all")
+            priority: Optional filter for task priority ("high", "medium", "low")
 
-    def update_task(self, user_id: str, task_id: str, task_data: TaskUpdate) -> Optional[Task]:
+        Yields:
+            Task schemas for the user
+        """
+        query = _task_list_statement(_completed_filter(status), bool(priority), False)
+
+        result = await self.db_session.stream(
+            query.execution_options(yield_per=200), {"user_id": user_id, "priority": priority}
+        )
+        async for row in result.mappings():
+            yield TaskSchema.model_validate(row)
+
+    async def update_task(self, user_id: str, task_id: str, task_data: TaskUpdate) -> Optional[Task]:
         """
         Update a specific task for a user.
 
@@ -112,24 +377,25 @@ class TaskService:
         Returns:
             The updated Task object if successful, None if task doesn't exist or doesn't belong to user
         """
-        # Get the existing task
-        task = self.get_task_by_id(user_id, task_id)
-        if not task:
-            return None
-
-        # Update the task with provided data
-        update_data = task_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-
-        # Commit the changes and refresh the task
-        self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
+        # Tags are accepted by the schema but not persisted
+        update_data = task_data.model_dump(exclude_unset=True, exclude={"tags"})
+        if not update_data:
+            return await self.get_task_by_id(user_id, task_id)
+
+        # Update the task and read it back in a single statement
+        result = await self.db_session.execute(
+            update(Task)
+            .where(Task.user_id == user_id, Task.id == task_id)
+            .values(**update_data)
+            .returning(Task)
+            .options(*_TASK_LOAD_OPTIONS)
+        )
+        task = result.scalar_one_or_none()
 
+        self._remember(user_id, task_id, task)
         return task
 
-    def delete_task(self, user_id: str, task_id: str) -> bool:
+    async def delete_task(self, user_id: str, task_id: str) -> bool:
         """
         Delete a specific task for a user.
 
@@ -140,18 +406,16 @@ class TaskService:
         Returns:
             True if the task was deleted, False if it didn't exist or didn't belong to user
         """
-        # Get the existing task
-        task = self.get_task_by_id(user_id, task_id)
-        if not task:
-            return False
-
-        # Delete the task
-        self.db_session.delete(task)
-        self.db_session.commit()
+        # Delete the task only if it belongs to the user
+        result = await self.db_session.execute(
+            _STMT_DELETE_TASK, {"uid": user_id, "tid": task_id}
+        )
+        deleted_id = result.scalar_one_or_none()
 
-        return True
+        self._cache.pop((user_id, task_id), None)
+        return deleted_id is not None
 
-    def toggle_task_completion(self, user_id: str, task_id: str, completed: bool) -> Optional[Task]:
+    async def toggle_task_completion(self, user_id: str, task_id: str, completed: bool) -> Optional[Task]:
         """
         Toggle the completion status of a specific task for a user.
 
@@ -163,17 +427,53 @@ class TaskService:
         Returns:
             The updated Task object if successful, None if task doesn't exist or doesn't belong to user
         """
-        # Get the existing task
-        task = self.get_task_by_id(user_id, task_id)
-        if not task:
-            return None
+        # Update the completion status and read the task back in a single statement
+        result = await self.db_session.execute(
+            _STMT_SET_TASK_COMPLETED, {"uid": user_id, "tid": task_id, "completed_value": completed}
+        )
+        task = result.scalar_one_or_none()
+
+        self._remember(user_id, task_id, task)
+        return task
+
+    async def toggle_many(self, user_id: str, task_ids: List[str], completed: bool) -> int:
+        """
+        Set the completion status of several of a user's tasks at once.
+
+        Args:
+            user_id: The ID of the user
+            task_ids: The IDs of the tasks to update
+            completed: The new completion status
 
-        # Update the completion status
-        task.completed = completed
+        Returns:
+            The number of tasks updated; IDs that don't exist or don't belong
+            to the user are skipped
+        """
+        # One UPDATE for the whole batch. Skipping session synchronization
+        # avoids evaluating the criteria against every object in the session;
+        # instead, only the requested tasks that are already loaded are
+        # expired below, so their next access reloads them from the database.
+        result = await self.db_session.execute(
+            update(Task)
+            .where(Task.user_id == user_id, Task.id.in_(task_ids))
+            .values(completed=completed)
+            .execution_options(synchronize_session=False)
+        )
+
+        for task_id in task_ids:
+            self._cache.pop((user_id, task_id), None)
+            loaded = self.db_session.identity_map.get(self.db_session.identity_key(Task, task_id))
+            if loaded is not None:
+                self.db_session.expire(loaded)
 
-        # Commit the changes and refresh the task
-        self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
+        return result.rowcount
 
-        return task
\ No newline at end of file
+    def _remember(self, user_id: str, task_id: str, task: Optional[Task]) -> None:
+        """
+        Record the outcome of a mutation in the request-scoped task cache.
+        """
+        key = (user_id, task_id)
+        if task is None:
+            self._cache.pop(key, None)
+        else:
+            self._cache[key] = task
\ No newline at end of file
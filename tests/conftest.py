@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the Todo Application backend tests.
+"""
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+# Configure the app before any of its modules are imported: keep a developer's
+# .env out of the tests and skip bcrypt calibration
+os.environ["SKIP_DOTENV"] = "1"
+os.environ["DATABASE_URL"] = "sqlite:///./test-unused.db"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.database import Base
+import models.database  # noqa: F401  (registers the tables on Base.metadata)
+
+
+@pytest.fixture
+def run_db(tmp_path):
+    """
+    Run an async test scenario against a fresh SQLite database.
+
+    The scenario is called with the engine and a session factory configured
+    like the application's. Each scenario gets its own event loop, so the
+    engine does not pool connections across tests.
+    """
+    def run(scenario):
+        async def main():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+                session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+                await scenario(engine, session_factory)
+            finally:
+                await engine.dispose()
+
+        asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Context manager that records every SQL statement an engine sends to the
+    database, for asserting how many queries a code path emits.
+    """
+    @contextmanager
+    def recorder(engine):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return recorder
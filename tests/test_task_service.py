@@ -0,0 +1,182 @@
+"""
+Tests for TaskService query behaviour and session consistency.
+"""
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from models.database import Task, User
+from schemas.task import TaskCreate
+from services.task_service import TaskService, decode_task_cursor, encode_task_cursor
+
+
+async def _create_user_with_tasks(session_factory, count=3):
+    """
+    Commit a user with `count` tasks and return their IDs.
+    """
+    async with session_factory() as session:
+        user = User(email="user@example.com", hashed_password="not-a-real-hash")
+        session.add(user)
+        await session.flush()
+
+        service = TaskService(session)
+        tasks = [await service.create_task(user.id, TaskCreate(title=f"Task {i}")) for i in range(count)]
+        await session.commit()
+
+        return user.id, [task.id for task in tasks]
+
+
+def test_list_tasks_emits_one_query(run_db, count_queries):
+    async def scenario(engine, session_factory):
+        user_id, _ = await _create_user_with_tasks(session_factory)
+
+        async with session_factory() as session:
+            service = TaskService(session)
+            with count_queries(engine) as statements:
+                rows = await service.get_tasks_by_user(user_id)
+            assert len(rows) == 3
+            assert len(statements) == 1
+
+            with count_queries(engine) as statements:
+                rows = await service.get_tasks_by_user(user_id, status="incomplete", priority="medium", summary=True)
+            assert len(rows) == 3
+            assert len(statements) == 1
+
+    run_db(scenario)
+
+
+def test_repeated_task_lookup_does_not_query_again(run_db, count_queries):
+    async def scenario(engine, session_factory):
+        user_id, task_ids = await _create_user_with_tasks(session_factory, count=1)
+
+        async with session_factory() as session:
+            service = TaskService(session)
+            with count_queries(engine) as statements:
+                first = await service.get_task_by_id(user_id, task_ids[0])
+                second = await service.get_task_by_id(user_id, task_ids[0])
+
+        assert first is second
+        assert len(statements) == 1
+
+    run_db(scenario)
+
+
+def test_task_relationships_raise_instead_of_lazy_loading(run_db, count_queries):
+    async def scenario(engine, session_factory):
+        user_id, task_ids = await _create_user_with_tasks(session_factory, count=1)
+
+        async with session_factory() as session:
+            task = await TaskService(session).get_task_by_id(user_id, task_ids[0])
+
+            with count_queries(engine) as statements:
+                with pytest.raises(InvalidRequestError):
+                    task.user
+
+        assert statements == []
+
+    run_db(scenario)
+
+
+def test_toggle_updates_task_already_loaded_in_session(run_db):
+    async def scenario(engine, session_factory):
+        user_id, task_ids = await _create_user_with_tasks(session_factory, count=1)
+
+        async with session_factory() as session:
+            service = TaskService(session)
+            loaded = await service.get_task_by_id(user_id, task_ids[0])
+            assert loaded.completed is False
+
+            toggled = await service.toggle_task_completion(user_id, task_ids[0], True)
+            assert toggled is loaded
+            assert toggled.completed is True
+            assert (await service.get_task_by_id(user_id, task_ids[0])).completed is True
+
+            await service.toggle_task_completion(user_id, task_ids[0], False)
+            assert loaded.completed is False
+            await session.commit()
+
+        async with session_factory() as session:
+            assert (await session.get(Task, task_ids[0])).completed is False
+
+    run_db(scenario)
+
+
+def test_toggle_many_refreshes_tasks_already_loaded_in_session(run_db):
+    async def scenario(engine, session_factory):
+        user_id, task_ids = await _create_user_with_tasks(session_factory, count=2)
+
+        async with session_factory() as session:
+            service = TaskService(session)
+            loaded = await service.toggle_task_completion(user_id, task_ids[0], True)
+            assert loaded.completed is True
+
+            assert await service.toggle_many(user_id, task_ids, False) == 2
+
+            reloaded = await service.get_task_by_id(user_id, task_ids[0])
+            assert reloaded is loaded
+            assert reloaded.completed is False
+            assert (await service.get_task_by_id(user_id, task_ids[1])).completed is False
+
+    run_db(scenario)
+
+
+def test_delete_evicts_task_already_loaded_in_session(run_db):
+    async def scenario(engine, session_factory):
+        user_id, task_ids = await _create_user_with_tasks(session_factory, count=1)
+
+        async with session_factory() as session:
+            service = TaskService(session)
+            # Hold a reference, as a caller would; the identity map only keeps
+            # objects that are still referenced somewhere
+            loaded = await service.get_task_by_id(user_id, task_ids[0])
+            assert loaded is not None
+
+            assert await service.delete_task(user_id, task_ids[0]) is True
+            assert await session.get(Task, task_ids[0]) is None
+            assert await service.get_task_by_id(user_id, task_ids[0]) is None
+            assert await TaskService(session).get_task_by_id(user_id, task_ids[0]) is None
+
+            assert await service.delete_task(user_id, task_ids[0]) is False
+
+    run_db(scenario)
+
+
+def test_task_list_pages_follow_cursor_through_same_second_tasks(run_db):
+    async def scenario(engine, session_factory):
+        user_id, _ = await _create_user_with_tasks(session_factory, count=0)
+
+        # A bulk insert shares one transaction timestamp, so every task has the
+        # same created_at and the page boundaries fall inside a tie
+        async with session_factory() as session:
+            created = await TaskService(session).create_tasks_bulk(
+                user_id, [TaskCreate(title=f"Task {i}") for i in range(7)]
+            )
+            await session.commit()
+        assert len({task.created_at for task in created}) == 1
+
+        seen = []
+        cursor = None
+        async with session_factory() as session:
+            service = TaskService(session)
+            # Bounded so a cursor that fails to advance fails the test
+            # instead of looping forever
+            for _ in range(len(created)):
+                rows = await service.get_tasks_by_user(user_id, limit=3, cursor=cursor)
+                seen.extend((row["created_at"], row["id"]) for row in rows)
+                if len(rows) < 3:
+                    break
+                cursor = decode_task_cursor(encode_task_cursor(rows[-1]["created_at"], rows[-1]["id"]))
+
+        assert sorted(task_id for _, task_id in seen) == sorted(task.id for task in created)
+        assert seen == sorted(seen, reverse=True)
+
+    run_db(scenario)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    "2026-10-15T09:00:00_not-a-uuid",
+    "2026-10-15T09:00:00+05:00_9b2f6f0e-8c1a-4f4e-9a57-0f3c1d2e4b5a",
+])
+def test_decode_task_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(ValueError):
+        decode_task_cursor(cursor)